@@ -10,15 +10,27 @@ from func import (
     powell, quartic, rotated_hyper_ellipsoid, discus, exponential
 )
 from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Queue
 from tabulate import tabulate
 from visualize import visualize_results, create_unigraph
+from progress import ProgressReporter, ProgressMonitor
+
+
+# Progress queue shared with workers (set by init_worker in each process)
+progress_queue = None
+
+
+def init_worker(queue):
+    """Store the parent's progress queue in the worker process."""
+    global progress_queue
+    progress_queue = queue
 
 
 def run_experiment(args):
     """Run a single experiment (called by each worker)."""
     name, fn, neighbors, tenure, max_iter, bounds, dims = args
-    print(f"Running {name}...")
-    result = run_tabu(fn, NUM_RUNS, neighbors, tenure, max_iter, bounds, dims)
+    progress = ProgressReporter(progress_queue, name, NUM_RUNS, max_iter) if progress_queue is not None else None
+    result = run_tabu(fn, NUM_RUNS, neighbors, tenure, max_iter, bounds, dims, progress=progress)
     return (name, result, NUM_RUNS, neighbors, tenure, max_iter, bounds, dims)
 
 
@@ -82,8 +94,12 @@ if __name__ == "__main__":
     # Run all experiments concurrently (leave 2 cores free)
     import os
     max_workers = max(1, os.cpu_count() - 2)
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        results = list(executor.map(run_experiment, experiments))
+    queue = Queue()
+    # Live progress table on stdout, raw snapshots in progress.jsonl (tail -f)
+    with ProgressMonitor(queue):
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker,
+                                 initargs=(queue,)) as executor:
+            results = list(executor.map(run_experiment, experiments))
     
     # Sort results by best_f to assign ranks
     sorted_results = sorted(results, key=lambda x: x[1]['best_f'])
@@ -0,0 +1,159 @@
+"""
+Live progress telemetry for concurrent experiment sweeps.
+
+Workers publish throttled snapshots through a multiprocessing queue;
+the parent drains it, renders a live console table and appends every
+snapshot to a JSON-lines metrics file that can be tailed.
+"""
+
+import json
+import sys
+import threading
+import time
+from queue import Empty
+
+from tabulate import tabulate
+
+
+REPORT_INTERVAL = 1.0   # Seconds between snapshots sent by a worker
+REFRESH_INTERVAL = 2.0  # Seconds between console redraws in the parent
+METRICS_FILE = "progress.jsonl"
+
+_STOP = None  # Sentinel put on the queue to stop the monitor
+
+
+class ProgressReporter:
+    """
+    Worker-side publisher. Call it once per tabu iteration; it only touches
+    the queue when REPORT_INTERVAL has elapsed, so the hot loop pays a
+    single clock read per iteration.
+    """
+
+    def __init__(self, queue, name, num_runs, max_iter, interval=REPORT_INTERVAL):
+        self.queue = queue
+        self.name = name
+        self.num_runs = num_runs
+        self.max_iter = max_iter
+        self.interval = interval
+        self.run = 0
+        self.evaluations = 0
+        self.best_f = float('inf')
+        self.start = time.monotonic()
+        self._next_report = self.start + interval
+        self._run_evaluations = 0
+        self._run_best_f = float('inf')
+
+    def start_run(self, run):
+        """Fold the previous run into the totals and start run `run`."""
+        self.run = run
+        self.evaluations += self._run_evaluations
+        self.best_f = min(self.best_f, self._run_best_f)
+        self._run_evaluations = 0
+        self._run_best_f = float('inf')
+
+    def __call__(self, iteration, best_f, evaluations):
+        """Record the state after `iteration`; publish if the interval elapsed."""
+        self._run_evaluations = evaluations
+        self._run_best_f = best_f
+        now = time.monotonic()
+        if now >= self._next_report:
+            self._publish(now, iteration, "running")
+            self._next_report = now + self.interval
+
+    def finish(self):
+        """Publish a final snapshot for the whole experiment."""
+        self.start_run(self.num_runs - 1)
+        self._publish(time.monotonic(), self.max_iter, "done")
+
+    def _publish(self, now, iteration, status):
+        elapsed = now - self.start
+        total = self.num_runs * self.max_iter
+        done = min(total, self.run * self.max_iter + iteration)
+        fraction = done / total if total else 1.0
+        evaluations = self.evaluations + self._run_evaluations
+        best_f = min(self.best_f, self._run_best_f)
+        eta = elapsed * (1 - fraction) / fraction if fraction > 0 else None
+        self.queue.put({
+            "time": time.time(),
+            "name": self.name,
+            "status": status,
+            "run": self.run,
+            "num_runs": self.num_runs,
+            "iteration": iteration,
+            "max_iter": self.max_iter,
+            "best_f": best_f,
+            "evaluations": evaluations,
+            "evals_per_sec": evaluations / elapsed if elapsed > 0 else 0.0,
+            "progress": fraction,
+            "eta": eta,
+        })
+
+
+class ProgressMonitor:
+    """
+    Parent-side aggregator. Runs a background thread that drains the queue,
+    keeps the latest snapshot per experiment, appends each snapshot to the
+    metrics file and periodically redraws a summary table.
+    """
+
+    def __init__(self, queue, metrics_path=METRICS_FILE, refresh=REFRESH_INTERVAL, stream=sys.stdout):
+        self.queue = queue
+        self.metrics_path = metrics_path
+        self.refresh = refresh
+        self.stream = stream
+        self.latest = {}
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.queue.put(_STOP)
+        self._thread.join()
+        return False
+
+    def _loop(self):
+        next_draw = time.monotonic() + self.refresh
+        with open(self.metrics_path, "w") as metrics:
+            while True:
+                timeout = max(0.0, next_draw - time.monotonic())
+                try:
+                    snapshot = self.queue.get(timeout=timeout)
+                except Empty:
+                    snapshot = None
+                else:
+                    if snapshot is _STOP:
+                        break
+                    self.latest[snapshot["name"]] = snapshot
+                    metrics.write(json.dumps(snapshot) + "\n")
+                    metrics.flush()
+
+                if time.monotonic() >= next_draw:
+                    self.render()
+                    next_draw = time.monotonic() + self.refresh
+        self.render()
+
+    def render(self):
+        """Print the latest snapshot of every experiment as a table."""
+        if not self.latest:
+            return
+        rows = []
+        for s in sorted(self.latest.values(), key=lambda s: s["name"]):
+            eta = "-" if s["eta"] is None else f"{s['eta']:.0f}s"
+            rows.append([
+                s["name"],
+                s["status"],
+                f"{s['run'] + 1}/{s['num_runs']}",
+                f"{s['iteration']}/{s['max_iter']}",
+                f"{s['best_f']:.4e}",
+                f"{s['evals_per_sec']:.0f}",
+                f"{s['progress']:.0%}",
+                eta,
+            ])
+        headers = ["Function", "Status", "Run", "Iter", "Best f", "Evals/s", "Done", "ETA"]
+        table = tabulate(rows, headers=headers, tablefmt="simple", disable_numparse=True)
+        if self.stream.isatty():
+            self.stream.write("\033[H\033[J")  # Clear screen for an in-place view
+        self.stream.write(table + "\n\n")
+        self.stream.flush()
@@ -4,10 +4,12 @@ from tabu import tabu_search
 import numpy as np
 
 
-def run_tabu(fn, num_runs=25, neighbors=10, tenure=5, max_iter=1000, bounds=(-5, 5), dims=5):
+def run_tabu(fn, num_runs=25, neighbors=10, tenure=5, max_iter=1000, bounds=(-5, 5), dims=5,
+             progress=None):
     """
     Run tabu search multiple times with deterministic seed policy.
     Random initial seed, then doubles after each run.
+    Optional `progress` is a ProgressReporter that receives live snapshots.
     """
     best_f = float('inf')
     best_x = None
@@ -20,10 +22,13 @@ def run_tabu(fn, num_runs=25, neighbors=10, tenure=5, max_iter=1000, bounds=(-5,
     for run in range(num_runs):
         # Set seed for reproducibility
         np.random.seed(seed)
+        if progress is not None:
+            progress.start_run(run)
         
         x0 = np.random.uniform(bounds[0], bounds[1], size=dims)
         x, f, _, _, _ = tabu_search(fn, x0, tenure=tenure, max_iter=max_iter, 
-                                     bounds=bounds, neighbors_size=neighbors)
+                                     bounds=bounds, neighbors_size=neighbors,
+                                     progress=progress)
         all_f.append(f)
         if f < best_f:
             best_f = f
@@ -32,6 +37,9 @@ def run_tabu(fn, num_runs=25, neighbors=10, tenure=5, max_iter=1000, bounds=(-5,
         # Increment seed for next run (avoids overflow)
         seed += 12345
     
+    if progress is not None:
+        progress.finish()
+    
     return {
         "best_x": best_x,
         "best_f": best_f,
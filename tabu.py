@@ -1,7 +1,7 @@
 import statistics
 import numpy as np
 
-def tabu_search(func, x0, tenure=2, max_iter=100, bounds=None, neighbors_size=10):
+def tabu_search(func, x0, tenure=2, max_iter=100, bounds=None, neighbors_size=10, progress=None):
     num_dimensions = len(x0)
     current_solution = list(x0)  # Use list for mutability
     best_solution = list(current_solution)
@@ -9,7 +9,7 @@ def tabu_search(func, x0, tenure=2, max_iter=100, bounds=None, neighbors_size=10
     tabu_list = {}
     all_objective_values = []
 
-    for _ in range(max_iter):
+    for iteration in range(max_iter):
         neighbors = []
 
         # Generate neighbors
@@ -74,6 +74,10 @@ def tabu_search(func, x0, tenure=2, max_iter=100, bounds=None, neighbors_size=10
         # Add the reverse of the chosen move to the tabu list
         # This prevents immediately reversing the last move
         tabu_list[reverse_move_identifier] = tenure
+
+        # Report progress (the callback throttles itself)
+        if progress is not None:
+            progress(iteration + 1, best_objective_value, len(all_objective_values))
     
     # Calculate statistics of all explored objective values
     avg_f = sum(all_objective_values) / len(all_objective_values) if all_objective_values else 0